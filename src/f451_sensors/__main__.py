@@ -1,80 +1,78 @@
 """Command-line interface."""
 import argparse
 import logging
-import os
-import re
 import sys
-from configparser import ConfigParser
-from configparser import ExtendedInterpolation
-from pathlib import Path
+import time
 from typing import Any
+from typing import Callable
 from typing import Dict
-from typing import List
+from typing import FrozenSet
 
-import konsole
-from faker import Faker
 from rich import print as rprint
-from rich import traceback
 from rich.rule import Rule
 
 import f451_sensors.constants as const
+from f451_sensors._cli_common import _APP_DIR_ABS_
+from f451_sensors._cli_common import load_config
 from f451_sensors.sensors import Sensors
 from f451_sensors.exceptions import MissingAttributeError
-from f451_sensors.exceptions import InvalidAttributeError
 from f451_sensors.exceptions import SensorAccessError
-from f451_sensors.exceptions import SensorConnectionError
 from . import __app_name__
 from . import __version__
 
 # =========================================================
 #          G L O B A L    V A R S   &   I N I T S
 # =========================================================
-traceback.install()  # Ensure 'pretty' tracebacks
-faker = Faker()  # Initialize 'Faker'
-
 _APP_NAME_: str = "f451 Sensors Module"
-_APP_NORMALIZED_: str = re.sub(r"[^A-Z0-9]", "_", str(__app_name__).upper())
-_APP_DIR_: Path = Path(__file__).parent
-
-# OS ENVIRON variable names
-_APP_ENV_CONFIG_: str = f"{_APP_NORMALIZED_}_CONFIG"
-_APP_ENV_SECRETS_: str = f"{_APP_NORMALIZED_}_SECRETS"
-
-# Default CONFIG, SECRETS, and LOG filenames
-# NOTE: these default filenames are used to search for files in degfault
-#       locations if no files are inicated in OS ENVIRON vars or supplied
-#       in CLI args.
-# NOTE: we allow user to store secrets (i.e. API keys and other environ
-#       secrets that should not go github), separately from 'safe' config
-#       values (i.e. info that is safe to share on github). But both types
-#       can also be stored in the same file.
+
+# Default LOG filename
 _APP_LOG_: str = "f451-sensors.log"
-_APP_CONFIG_: str = "f451-sensors.config.ini"
-_APP_SECRETS_: str = "f451-sensors.secrets.ini"
+_DEFAULT_LOG_PATH_: str = str(_APP_DIR_ABS_ / _APP_LOG_)
+
+_VERSION_ARGS_: FrozenSet[str] = frozenset(("-V", "--version"))
+_MSG_NO_SENSORS_: str = "There are no sensors enabled!"
+
+_RULE_: Rule = Rule()
+_HDR_SENSORS_: str = "[bold black on white] - Available Sensors - [/bold black on white]"
+_HDR_TEMP_: str = "[bold black on white] - Collect temperature data - [/bold black on white]"
 
 
 # =========================================================
 #              H E L P E R   F U N C T I O N S
 # =========================================================
 def collect_temperature_data(sensors: Sensors, maxRetry: int = 5, waitRetry: int = 1) -> Dict[str, Any]:
-    """Collect temperature data."""
-    rprint(Rule())
-    rprint("[bold black on white] - Collect temperature data - [/bold black on white]")
+    """Collect temperature data.
+
+    We retry up to 'maxRetry' times if no data is returned, and the
+    wait time between attempts doubles after each failed attempt.
+    """
+    rprint(_RULE_)
+    rprint(_HDR_TEMP_)
 
     data = None
-    attempts = 0
-    try:
-        while not data and attempts < maxRetry:
+    for attempt in range(maxRetry):
+        try:
             data = sensors.collect_temperature_data()
-            attempts += 1
-            rprint(f"{attempts =} - {data =}")
+            rprint(f"attempts = {attempt + 1} - {data =}")
+            if data:
+                break
 
-    except (MissingAttributeError, SensorAccessError) as e:
-        rprint(e)
+        except (MissingAttributeError, SensorAccessError) as e:
+            rprint(e)
+
+        if attempt + 1 < maxRetry:
+            time.sleep(waitRetry * (1 << attempt))
 
     return data
 
 
+# Map sensor names to demo functions. Each demo is called with
+# the 'Sensors' instance as its only argument.
+_DEMOS_: Dict[str, Callable[[Sensors], Any]] = {
+    const.SENSOR_TEMP: collect_temperature_data,
+}
+
+
 def init_cli_parser() -> argparse.ArgumentParser:
     """Initialize CLI (ArgParse) parser.
 
@@ -126,56 +124,6 @@ def init_cli_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def init_ini_parser(fNames: Any) -> ConfigParser:
-    """Initialize ConfigParser.
-
-    Args:
-        fNames:
-            list with one or more paths to config files
-
-    Returns:
-        ConfigParser instance
-
-    Raises:
-        ValueError: Config file does not exist
-    """
-    parser = ConfigParser(interpolation=ExtendedInterpolation())
-
-    tmpList = fNames if isinstance(fNames, list) else [fNames]
-    for fn in tmpList:
-        tmpName = Path(fn).expanduser()
-        if not tmpName.exists():
-            raise ValueError(f"Config file '{tmpName}' does not exist.")
-
-        parser.read(tmpName)
-
-    return parser
-
-
-def get_valid_location(inFName: str) -> str:
-    """Get valid location for a given filename.
-
-    We use this to look for a given file (mainly config
-    files) in a few default locations.
-
-    Args:
-        inFName:
-            filename (string) to look for
-
-    Returns:
-        filename as string
-    """
-    cleanFName = inFName.strip("/")
-    defaultLocations = [
-        f"{Path.cwd()}/{cleanFName}",
-        f"{Path(__file__).parent.absolute()}/{cleanFName}",
-        f"{Path.home()}/{cleanFName}",
-        f"/etc/{__app_name__}/{cleanFName}",
-    ]
-
-    return next((str(item) for item in defaultLocations if Path(item).exists()), "")
-
-
 # =========================================================
 #      M A I N   F U N C T I O N    /   A C T I O N S
 # =========================================================
@@ -197,6 +145,14 @@ def main(inArgs: Any = None) -> None:  # noqa: C901
         inArgs:
             CLI arguments used to start application
     """
+    # Skip the full parser when all we need is the version number. We
+    # only do this when the version flag is the sole argument, so that
+    # e.g. '--sensor -V' is still rejected by the parser.
+    args = sys.argv[1:] if inArgs is None else inArgs
+    if len(args) == 1 and args[0] in _VERSION_ARGS_:
+        rprint(f"{_APP_NAME_} ({__app_name__}) v{__version__}")
+        sys.exit(0)
+
     cli = init_cli_parser()
 
     # Show 'help' and exit if no args
@@ -209,64 +165,56 @@ def main(inArgs: Any = None) -> None:  # noqa: C901
         rprint(f"{_APP_NAME_} ({__app_name__}) v{__version__}")
         sys.exit(0)
 
+    # Heavier imports are deferred until we know that we're not just
+    # displaying 'help' or 'version' info.
+    import konsole
+    from rich import traceback
+
+    traceback.install()  # Ensure 'pretty' tracebacks
+
     # Initialize loggers
-    logger = logging.getLogger()
+    # NOTE: 'force=True' replaces any existing root handlers so that
+    #       repeated calls to 'main()' don't add duplicate handlers.
     logging.basicConfig(
-        filename=cliArgs.log or f"{_APP_DIR_}/{_APP_LOG_}",
+        filename=cliArgs.log or _DEFAULT_LOG_PATH_,
         # encoding="utf-8",     # Not available in Python v3.8
-        level=logging.INFO,
+        level=logging.DEBUG if cliArgs.debug else logging.INFO,
+        force=True,
     )
-    logger.setLevel(logging.DEBUG if cliArgs.debug else logging.INFO)
 
     konsole.config(level=konsole.DEBUG if cliArgs.debug else konsole.ERROR)
 
     # Initialize main Communications Module with 'config' and 'secrets' data
-    sensors = Sensors(
-        init_ini_parser(
-            [
-                (
-                    cliArgs.config
-                    or (
-                        os.environ.get(_APP_ENV_CONFIG_)
-                        or get_valid_location(_APP_CONFIG_)
-                    )
-                ),
-                (
-                    cliArgs.secrets
-                    or (
-                        os.environ.get(_APP_ENV_SECRETS_)
-                        or get_valid_location(_APP_SECRETS_)
-                    )
-                ),
-            ]
-        )
-    )
+    sensors = Sensors(load_config(cliArgs.config, cliArgs.secrets))
 
     # Exit if invalid sensor
-    availableSensors = (
+    # We use a 'frozenset' as we only need fast membership checks below
+    availableSensors = frozenset(
         sensors.valid_sensors
         if cliArgs.sensor == const.SENSOR_ALL
         else sensors.process_sensor_list(cliArgs.sensor.split(const.DELIM_STD))
     )
 
-    if not sensors.is_valid_sensor(availableSensors):
+    if not sensors.is_valid_sensor(list(availableSensors)):
         rprint(f"ERROR: '{cliArgs.sensor}' is not a valid sensor!")
         sys.exit(1)
 
     # -----------------------
     # Run sensor demos
     # -----------------------
-    rprint(Rule())
-    data = []
+    rprint(_RULE_)
 
     # -----------------------
-    rprint("[bold black on white] - Available Sensors - [/bold black on white]")
-    if sensors.sensors:
-        for key, val in sensors.sensors.items():  # type: ignore[union-attr]
-            rprint(f"{key:.<20.20}: {'ON' if val else 'OFF'}")
-    else:
-        rprint("There are no sensors enabled!")
-    rprint(Rule())
+    rprint(_HDR_SENSORS_)
+    rprint(
+        "\n".join(
+            f"{key:.<20.20}: {'ON' if val else 'OFF'}"
+            for key, val in sensors.sensors.items()  # type: ignore[union-attr]
+        )
+        if sensors.sensors
+        else _MSG_NO_SENSORS_
+    )
+    rprint(_RULE_)
 
     # # -----------------------
     # # - 1 - Broadcast message based on args
@@ -280,28 +228,16 @@ def main(inArgs: Any = None) -> None:  # noqa: C901
     #     rprint(e)
 
     # -----------------------
-    # - 2 - Collect data from
-    if const.SENSOR_TEMP in availableSensors:
-        data.append(collect_temperature_data(sensors))
-
-    # # -----------------------
-    # # - 3 - Send messages via Slack
-    # if const.SENSOR_SLACK in availableSensors:
-    #     send_test_msg_via_slack(sensors, cliArgs.msg)
-
-    # # -----------------------
-    # # - 4 - Send SMS via Twilio
-    # if const.SENSOR_TWILIO in availableSensors:
-    #     send_test_msg_via_twilio(sensors, cliArgs.msg)
-
-    # # -----------------------
-    # # - 5 - Send tweets and DMs via Twitter
-    # if const.SENSOR_TWITTER in availableSensors:
-    #     send_test_msg_via_twitter(sensors, cliArgs.msg)
+    # - 2 - Collect data from available sensors
+    # NOTE: demos print their own progress, so we run them one at a
+    #       time to keep console output readable.
+    for name, demo in _DEMOS_.items():
+        if name in availableSensors:
+            demo(sensors)
 
     # -----------------------
     rprint("Hello world!")
-    rprint(Rule())
+    rprint(_RULE_)
 
 
 # =========================================================
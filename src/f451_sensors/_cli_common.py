@@ -0,0 +1,153 @@
+"""Shared helpers for command-line interfaces.
+
+This module holds the helpers used by all f451 Sensors entry points
+to find and load 'config' and 'secrets' files.
+"""
+import functools
+import os
+import string
+from configparser import ConfigParser
+from pathlib import Path
+from typing import Any
+from typing import Tuple
+
+from . import __app_name__
+
+# =========================================================
+#          G L O B A L    V A R S   &   I N I T S
+# =========================================================
+_APP_NORM_TABLE_ = str.maketrans(
+    {
+        c: "_"
+        for c in map(chr, range(128))
+        if c not in string.ascii_uppercase + string.digits
+    }
+)
+_APP_NORMALIZED_: str = __app_name__.upper().translate(_APP_NORM_TABLE_)
+_APP_DIR_: Path = Path(__file__).parent
+_APP_DIR_ABS_: Path = _APP_DIR_.resolve()
+
+# Default search locations for config files. These are resolved once
+# at import time so that repeated lookups don't hit the filesystem.
+_LOC_PREFIXES_: Tuple[str, ...] = (
+    str(Path.cwd()),
+    str(_APP_DIR_ABS_),
+    str(Path.home()),
+    f"/etc/{__app_name__}",
+)
+
+# OS ENVIRON variable names
+_APP_ENV_CONFIG_: str = f"{_APP_NORMALIZED_}_CONFIG"
+_APP_ENV_SECRETS_: str = f"{_APP_NORMALIZED_}_SECRETS"
+
+# Default CONFIG and SECRETS filenames
+# NOTE: these default filenames are used to search for files in degfault
+#       locations if no files are inicated in OS ENVIRON vars or supplied
+#       in CLI args.
+# NOTE: we allow user to store secrets (i.e. API keys and other environ
+#       secrets that should not go github), separately from 'safe' config
+#       values (i.e. info that is safe to share on github). But both types
+#       can also be stored in the same file.
+_APP_CONFIG_: str = "f451-sensors.config.ini"
+_APP_SECRETS_: str = "f451-sensors.secrets.ini"
+
+
+# =========================================================
+#              H E L P E R   F U N C T I O N S
+# =========================================================
+def init_ini_parser(fNames: Any) -> ConfigParser:
+    """Initialize ConfigParser.
+
+    Args:
+        fNames:
+            list with one or more paths to config files
+
+    Returns:
+        ConfigParser instance
+
+    Raises:
+        ValueError: Config file does not exist or could not be read
+    """
+    tmpList = fNames if isinstance(fNames, list) else [fNames]
+    fileList = [os.path.expanduser(fn) for fn in tmpList if fn]
+
+    # 'read()' skips files that cannot be opened, so we compare the
+    # list of files actually read against the list we asked for.
+    # NOTE: config files do not use '${section:key}' references, so we
+    #       skip interpolation and return raw values on every 'get()'.
+    parser = ConfigParser(interpolation=None)
+    readList = parser.read(fileList)
+
+    missing = [fn for fn in fileList if fn not in readList]
+    if missing:
+        raise ValueError(f"Config file {missing[0]!r} could not be read.")
+
+    return parser
+
+
+@functools.lru_cache(maxsize=None)
+def get_valid_location(inFName: str) -> str:
+    """Get valid location for a given filename.
+
+    We use this to look for a given file (mainly config
+    files) in a few default locations. Results are cached
+    per filename.
+
+    Args:
+        inFName:
+            filename (string) to look for
+
+    Returns:
+        filename as string
+    """
+    cleanFName = inFName.strip("/")
+    for prefix in _LOC_PREFIXES_:
+        item = f"{prefix}/{cleanFName}"
+        if os.path.exists(item):
+            return item
+
+    return ""
+
+
+def _resolve_config_path(cliVal: Any, envKey: str, defaultFName: str) -> str:
+    """Resolve path to config file.
+
+    The precedence order is: CLI argument, OS ENVIRON variable,
+    and finally default locations. Later sources are only checked
+    if earlier sources are empty.
+
+    Args:
+        cliVal:
+            path (string) from CLI args (can be 'None')
+        envKey:
+            name of OS ENVIRON variable with path
+        defaultFName:
+            filename to look for in default locations
+
+    Returns:
+        filename as string
+    """
+    return cliVal or os.environ.get(envKey) or get_valid_location(defaultFName)
+
+
+def load_config(configPath: Any = None, secretsPath: Any = None) -> ConfigParser:
+    """Load 'config' and 'secrets' files.
+
+    Paths that are not given are resolved via OS ENVIRON variables
+    and default locations (see '_resolve_config_path()').
+
+    Args:
+        configPath:
+            path (string) to config file (can be 'None')
+        secretsPath:
+            path (string) to secrets file (can be 'None')
+
+    Returns:
+        ConfigParser instance
+    """
+    return init_ini_parser(
+        [
+            _resolve_config_path(configPath, _APP_ENV_CONFIG_, _APP_CONFIG_),
+            _resolve_config_path(secretsPath, _APP_ENV_SECRETS_, _APP_SECRETS_),
+        ]
+    )
@@ -22,21 +22,30 @@ SENSOR_WIND: str = "f451_wind"
 SENSOR_RAIN: str = "f451_rain"
 SENSOR_SPEED: str = "f451_speed"
 
+SRVC_MQTT: str = "f451_mqtt"
+SRVC_INFLUXDB: str = "f451_influxdb"
+
 KWD_ACCT_SID: str = "acct_sid"
 KWD_APP_TOKEN: str = "app_token"
 KWD_ATTACHMENTS: str = "attachments"  # Attachments for email and Slack
 KWD_AUTH_SECRET: str = "auth_secret"
 KWD_AUTH_TOKEN: str = "auth_token"
+KWD_BUCKET: str = "bucket"
+KWD_CLIENT_ID: str = "client_id"
 KWD_SENSORS: str = "sensors"
 KWD_SENSOR_MAP: str = "sensor_map"
 KWD_DEBUG: str = "debug"  # Reserved
+KWD_HOST: str = "host"
 KWD_LOG_LEVEL: str = "log_level"
+KWD_ORG: str = "org"
 KWD_PRIV_KEY: str = "priv_api_key"
 KWD_PUBL_KEY: str = "publ_val_key"
 KWD_SIGN_SECRET: str = "signing_secret"
 KWD_SUPPRESS_ERROR: str = "suppress_errors"
 KWD_TAGS: str = "tags"
 KWD_TESTMODE: str = "testmode"
+KWD_TOPIC: str = "topic"
+KWD_URL: str = "url"
 KWD_USER_KEY: str = "user_key"
 KWD_USER_SECRET: str = "user_secret"
 KWD_WEB_HOOK_KEY: str = "webhook_sign_key"
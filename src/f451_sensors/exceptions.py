@@ -8,6 +8,7 @@ Note:
     by Or Carmi: https://github.com/liiight/notifiers
 """
 from typing import Any
+from typing import Optional
 
 # =========================================================
 #          G L O B A L S   A N D   H E L P E R S
@@ -41,10 +42,19 @@ class f451SensorsExceptionError(Exception):
         self.message = kwargs.get("message")
         self.data = kwargs.get("data")
         self.response = kwargs.get("response")
-        super().__init__(f"{self.service} - {self.message}")
+        self._str: Optional[str] = None
+        self._repr: Optional[str] = None
+        super().__init__(*args)
+
+    def __str__(self) -> str:
+        if self._str is None:
+            self._str = f"{self.service} - {self.message}"
+        return self._str
 
     def __repr__(self) -> str:
-        return f"<f451SensorsError: {self.message}>"
+        if self._repr is None:
+            self._repr = f"<{type(self).__name__}: {self.message}>"
+        return self._repr
 
 
 class InvalidAttributeError(f451SensorsExceptionError):
@@ -64,10 +74,7 @@ class InvalidAttributeError(f451SensorsExceptionError):
 
     def __init__(self, errMsg: str, *args: Any, **kwargs: Any) -> None:
         kwargs["message"] = f"Invalid attribute error: {errMsg}"
-        super().__init__(*args, **kwargs)
-
-    def __repr__(self) -> str:
-        return f"<InvalidAttributeError: {self.message}>"
+        super().__init__(errMsg, *args, **kwargs)
 
 
 class MissingAttributeError(f451SensorsExceptionError):
@@ -86,10 +93,7 @@ class MissingAttributeError(f451SensorsExceptionError):
 
     def __init__(self, errMsg: str, *args: Any, **kwargs: Any) -> None:
         kwargs["message"] = f"Missing attribute error: {errMsg}"
-        super().__init__(*args, **kwargs)
-
-    def __repr__(self) -> str:
-        return f"<MissingAttributeError: {self.message}>"
+        super().__init__(errMsg, *args, **kwargs)
 
 
 class InvalidSensorError(f451SensorsExceptionError):
@@ -109,10 +113,7 @@ class InvalidSensorError(f451SensorsExceptionError):
     def __init__(self, sensor: str, *args: Any, **kwargs: Any) -> None:
         self.sensor = sensor
         kwargs["message"] = f"Invalid sensor: {sensor}"
-        super().__init__(*args, **kwargs)
-
-    def __repr__(self) -> str:
-        return f"<InvalidStorageError: {self.sensor}>"
+        super().__init__(sensor, *args, **kwargs)
 
 
 class SensorAccessError(f451SensorsExceptionError):
@@ -132,10 +133,7 @@ class SensorAccessError(f451SensorsExceptionError):
     def __init__(self, sensor: str, *args: Any, **kwargs: Any) -> None:
         self.sensor = sensor
         kwargs["message"] = f"Unable to write data to sensor: {sensor}"
-        super().__init__(*args, **kwargs)
-
-    def __repr__(self) -> str:
-        return f"<InvalidStorageError: {self.sensor}>"
+        super().__init__(sensor, *args, **kwargs)
 
 
 class SensorConnectionError(f451SensorsExceptionError):
@@ -156,12 +154,26 @@ class SensorConnectionError(f451SensorsExceptionError):
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         self.errors = kwargs.pop("errors", None)
-        kwargs["message"] = (
-            _ERROR_UNKNOWN_
-            if self.errors is None
-            else f"Sensor connection errors: {','.join(self.errors)}"
-        )
+        self._message: Optional[str] = None
+        kwargs["message"] = None
         super().__init__(*args, **kwargs)
 
-    def __repr__(self) -> str:
-        return f"<SensorConnectionError: {self.message}>"
+    @property
+    def message(self) -> Optional[str]:
+        """Return 'message' property.
+
+        The error list is only joined into a message string the
+        first time the message is needed.
+        """
+        if self._message is None:
+            self._message = (
+                _ERROR_UNKNOWN_
+                if self.errors is None
+                else f"Sensor connection errors: {','.join(self.errors)}"
+            )
+        return self._message
+
+    @message.setter
+    def message(self, val: Optional[str]) -> None:
+        """Set 'message' property."""
+        self._message = val
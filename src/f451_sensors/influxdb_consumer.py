@@ -0,0 +1,155 @@
+"""MQTT consumer that stores sensor data in InfluxDB.
+
+This module subscribes to the MQTT topic used by the smart sensors and
+writes all samples to InfluxDB. Broker and InfluxDB settings are read
+from the same 'config' and 'secrets' files as the main CLI.
+
+Note:
+    * Store the InfluxDB auth token in the 'secrets' file.
+"""
+import argparse
+import json
+import logging
+import socket
+from configparser import ConfigParser
+from typing import Any
+from typing import Dict
+
+import paho.mqtt.client as mqtt
+from influxdb_client.client.influxdb_client import InfluxDBClient
+from influxdb_client.client.write.point import Point
+from influxdb_client.client.write_api import WriteOptions
+from influxdb_client.domain.write_precision import WritePrecision
+
+import f451_sensors.constants as const
+from f451_sensors._cli_common import load_config
+
+# =========================================================
+#          G L O B A L S   A N D   H E L P E R S
+# =========================================================
+log = logging.getLogger()
+
+# Defaults used when values are missing from config files
+MQTT_BROKER_URL: str = "mqtt.eclipseprojects.io"
+MQTT_PUBLISH_TOPIC: str = "temperature"
+MQTT_CLIENT_ID: str = "f451-sensors-influxdb-consumer"  # Suffixed with hostname
+
+INFLUXDB_URL: str = "http://localhost:8086"
+INFLUXDB_BUCKET: str = "f451_sensors"
+
+# Points are buffered by the InfluxDB client and written in batches
+# rather than one HTTP request per MQTT message.
+INFLUXDB_BATCH_SIZE: int = 500  # Max points per write
+INFLUXDB_FLUSH_INTERVAL: int = 1000  # Max msec between writes
+
+
+# =========================================================
+#              M Q T T   C A L L B A C K S
+# =========================================================
+def on_connect(client: Any, userdata: Dict[str, Any], flags: Dict[str, Any], rc: int) -> None:
+    """Subscribe to sensor topic once connected to MQTT broker."""
+    log.info(f"Connected to MQTT broker with result code {rc}")
+    client.subscribe(userdata[const.KWD_TOPIC])
+
+
+def on_message(client: Any, userdata: Dict[str, Any], msg: Any) -> None:
+    """Queue MQTT payload as InfluxDB points.
+
+    Each payload is a JSON list of '[timestamp_ns, value]' samples. The
+    write API (passed in via 'userdata') buffers the points, so this
+    callback never waits on a round-trip to InfluxDB.
+
+    Malformed payloads are logged and skipped, as any exception raised
+    here would stop the MQTT network loop.
+    """
+    try:
+        points = [
+            Point(msg.topic).field("value", float(val)).time(ts, WritePrecision.NS)
+            for ts, val in json.loads(msg.payload)
+        ]
+    except (ValueError, TypeError) as e:
+        log.warning(f"Skipping malformed payload on {msg.topic!r}: {e}")
+        return
+
+    userdata["writer"].write(
+        bucket=userdata[const.KWD_BUCKET],
+        org=userdata[const.KWD_ORG],
+        record=points,
+    )
+
+
+# =========================================================
+#      M A I N   F U N C T I O N    /   A C T I O N S
+# =========================================================
+def run(settings: ConfigParser) -> None:
+    """Consume MQTT messages and store them in InfluxDB.
+
+    Args:
+        settings:
+            ConfigParser instance with MQTT and InfluxDB settings
+    """
+    influxOrg = settings.get(const.SRVC_INFLUXDB, const.KWD_ORG, fallback="")
+    influxc = InfluxDBClient(
+        url=settings.get(const.SRVC_INFLUXDB, const.KWD_URL, fallback=INFLUXDB_URL),
+        token=settings.get(const.SRVC_INFLUXDB, const.KWD_AUTH_TOKEN, fallback=""),
+        org=influxOrg,
+    )
+    influxWriter = influxc.write_api(
+        write_options=WriteOptions(
+            batch_size=INFLUXDB_BATCH_SIZE,
+            flush_interval=INFLUXDB_FLUSH_INTERVAL,
+        )
+    )
+
+    # Client IDs must be unique per broker, or consumers will keep
+    # disconnecting each other. Clean sessions are fine since we
+    # re-subscribe in 'on_connect()' anyway.
+    mqttc = mqtt.Client(
+        client_id=settings.get(
+            const.SRVC_MQTT,
+            const.KWD_CLIENT_ID,
+            fallback=f"{MQTT_CLIENT_ID}-{socket.gethostname()}",
+        ),
+        clean_session=True,
+        userdata={
+            "writer": influxWriter,
+            const.KWD_BUCKET: settings.get(
+                const.SRVC_INFLUXDB, const.KWD_BUCKET, fallback=INFLUXDB_BUCKET
+            ),
+            const.KWD_ORG: influxOrg,
+            const.KWD_TOPIC: settings.get(
+                const.SRVC_MQTT, const.KWD_TOPIC, fallback=MQTT_PUBLISH_TOPIC
+            ),
+        },
+    )
+    mqttc.on_connect = on_connect
+    mqttc.on_message = on_message
+    mqttc.connect(settings.get(const.SRVC_MQTT, const.KWD_HOST, fallback=MQTT_BROKER_URL))
+
+    try:
+        mqttc.loop_forever()
+    finally:
+        influxWriter.close()  # Flush any buffered points
+        influxc.close()
+
+
+def main(inArgs: Any = None) -> None:
+    """Load config files and run consumer.
+
+    Args:
+        inArgs:
+            CLI arguments used to start consumer
+    """
+    parser = argparse.ArgumentParser(
+        prog="f451-influxdb-consumer",
+        description="Store f451 sensor data from MQTT broker in InfluxDB",
+    )
+    parser.add_argument("--secrets", action="store", type=str, help="Path to secrets file")
+    parser.add_argument("--config", action="store", type=str, help="Path to config file")
+    cliArgs = parser.parse_args(inArgs)
+
+    run(load_config(cliArgs.config, cliArgs.secrets))
+
+
+if __name__ == "__main__":
+    main()  # pragma: no cover
@@ -2,39 +2,103 @@
 MQTT Smart temperature Sensor
 """
 
+import json
+import random
 import time
-
-import paho.mqtt.client as mqtt
-from faker import Faker
+from typing import Any
 
 MIN_DELAY: int = 1     # Min 1 sec delay
 MAX_DELAY: int = 3600  # Max 1h delay
 
+# Samples are collected in batches and published as a single
+# JSON list of '[timestamp_ns, value]' pairs
+BATCH_SIZE: int = 10             # Max samples per message
+BATCH_MAX_AGE: int = 60          # Max sec between messages
+
 # let's connect to the MQTT broker
 MQTT_BROKER_URL    = "mqtt.eclipseprojects.io"
 MQTT_PUBLISH_TOPIC = "temperature"
+MQTT_FLUSH_TIMEOUT: int = 5      # Max sec to wait for final publish
 
-mqttc = mqtt.Client()
-mqttc.connect(MQTT_BROKER_URL)
-
-# Init faker our fake data provider
-fake = Faker()
+# MQTT client is created (and connected) on first use
+mqttc = None
 
 
 class Chameleon():
     pass
 
 
+def _get_mqtt_client() -> Any:
+    """Return MQTT client and connect on first call.
+
+    The client runs its network loop in a background thread, so
+    'publish()' just queues messages and never blocks on the socket.
+    We connect before starting the loop though, as QoS 0 messages
+    published before the connection is up are dropped. We also only
+    import 'paho' once we actually need a client.
+    """
+    global mqttc
+
+    if mqttc is None:
+        import paho.mqtt.client as mqtt
+
+        mqttc = mqtt.Client()
+        mqttc.connect(MQTT_BROKER_URL)
+        mqttc.loop_start()
+
+    return mqttc
+
+
+def _close_mqtt_client() -> None:
+    """Disconnect MQTT client and stop its network loop."""
+    global mqttc
+
+    if mqttc is not None:
+        mqttc.disconnect()
+        mqttc.loop_stop()
+        mqttc = None
+
+
 # Infinite loop of fake data sent to the Broker
 def run_smart_sensor(inDelay: int = 1, iterMax: int = 0) -> None:
     delay = max(min(inDelay, MAX_DELAY), MIN_DELAY)
+    client = _get_mqtt_client()
+    rng = random.Random()  # noqa: S311 - fake sensor data, not crypto
+    maxAge = BATCH_MAX_AGE * 1_000_000_000
+    batch = []
     cntr = 0
+    nextTime = time.monotonic()
+
+    try:
+        while cntr != iterMax:
+            if iterMax:
+                cntr += 1
+
+            temperature = rng.randrange(31)
+            now = time.time_ns()
+            batch.append((now, temperature))
+            print(f"Collected new temperature measurement: {temperature}")
 
-    while cntr != iterMax:
-        if iterMax:
-            cntr += 1
+            if len(batch) >= BATCH_SIZE or (now - batch[0][0]) >= maxAge:
+                client.publish(MQTT_PUBLISH_TOPIC, json.dumps(batch), qos=0)
+                batch.clear()
 
-        temperature = fake.random_int(min=0, max=30)
-        mqttc.publish(MQTT_PUBLISH_TOPIC, temperature)
-        print(f"Published new temperature measurement: {temperature}")
-        time.sleep(delay)
+            # Sleep until next deadline so that time spent collecting and
+            # publishing data doesn't cause the sample rate to drift. If we
+            # fall behind by more than a full period, then we reset the
+            # schedule rather than trying to catch up.
+            nextTime += delay
+            sleepTime = nextTime - time.monotonic()
+            if sleepTime > 0:
+                time.sleep(sleepTime)
+            elif sleepTime < -delay:
+                print(f"Sensor is running {-sleepTime:.1f} sec behind schedule")
+                nextTime = time.monotonic()
+    finally:
+        # Flush remaining samples and wait for them to go out, as
+        # the network loop is stopped right after.
+        if batch:
+            msgInfo = client.publish(MQTT_PUBLISH_TOPIC, json.dumps(batch), qos=0)
+            if msgInfo.rc == 0:
+                msgInfo.wait_for_publish(MQTT_FLUSH_TIMEOUT)
+        _close_mqtt_client()
@@ -3,11 +3,14 @@
 This module holds base classes used for various sensor
 components (e.g. temperature, humidity, speed, etc.).
 """
+import functools
 import logging
+import os
 import pprint
+import stat
 from abc import ABC
 from abc import abstractmethod
-from pathlib import Path
+from collections import deque
 from typing import Any
 from typing import Dict
 from typing import List
@@ -15,9 +18,6 @@ from typing import Optional
 from typing import Union
 
 from requests import Response as reqResponse
-from rich import print as rprint
-from rich.pretty import pprint as rpp
-from rich.rule import Rule
 
 import f451_sensors.constants as const
 from f451_sensors.exceptions import InvalidAttributeError
@@ -79,6 +79,10 @@ class Response:
         by Or Carmi: https://github.com/liiight/notifiers
     """
 
+    # Responses are created for every call to a sensor, so we use
+    # '__slots__' to keep instances small.
+    __slots__ = ("status", "sensor", "data", "response", "errors")
+
     def __init__(
         self,
         status: str,
@@ -87,11 +91,11 @@ class Response:
         response: Optional[reqResponse] = None,
         errors: Any = None,
     ):
-        self.status: str = status
-        self.sensor: str = sensor
-        self.data: Any = data
-        self.response: Optional[reqResponse] = response
-        self.errors: Any = errors
+        self.status = status
+        self.sensor = sensor
+        self.data = data
+        self.response = response
+        self.errors = errors
 
     def __repr__(self) -> str:
         return f"<Response,sensor={self.sensor.capitalize()},status={self.status}, errors={self.errors}>"  # noqa: B950
@@ -102,13 +106,16 @@ class Response:
         Raises:
              SensorConnectionError: if request response has errors
         """
-        if self.errors:
-            raise SensorConnectionError(
-                sensor=self.sensor,
-                data=self.data,
-                errors=self.errors,
-                response=self.response,
-            )
+        errors = self.errors
+        if not errors:
+            return
+
+        raise SensorConnectionError(
+            sensor=self.sensor,
+            data=self.data,
+            errors=errors,
+            response=self.response,
+        )
 
     @property
     def isOK(self) -> bool:
@@ -145,9 +152,10 @@ class Sensor(ABC):
         self._sctnName: str = configSection
         self._mqttHost: str = mqttHost
         self._mqttTopic: str = mqttTopic
+        self._repr: str = f"<Sensor, type={sensorType}, name={sensorName}>"
 
     def __repr__(self) -> str:
-        return f"<Sensor, type={self._snsrType}, name={self._snsrName}>"
+        return self._repr
 
     @property
     def sensorType(self) -> str:
@@ -220,9 +228,13 @@ class Sensor(ABC):
 # =========================================================
 #              U T I L I T Y   F U N C T I O N S
 # =========================================================
-def is_valid_file(fName: Union[Path, str]) -> bool:
+@functools.lru_cache(maxsize=1024)
+def is_valid_file(fName: Union["os.PathLike[str]", str]) -> bool:
     """Verify that a file exists.
 
+    Results are cached per filename. Call 'is_valid_file.cache_clear()'
+    if files may have been created or removed since the last check.
+
     Args:
         fName:
             Single filename (Path object or string).
@@ -230,8 +242,12 @@ def is_valid_file(fName: Union[Path, str]) -> bool:
     Returns:
         'True' if files exists.
     """
-    fp = Path(fName) if isinstance(fName, str) else fName
-    return fp.exists() and fp.is_file()
+    try:
+        # 'S_ISREG' implies that the file exists, so one 'stat' call
+        # replaces separate 'exists' and 'is_file' checks.
+        return stat.S_ISREG(os.stat(os.fspath(fName)).st_mode)
+    except OSError:
+        return False
 
 
 def verify_file(fName: str, strict: bool) -> str:
@@ -264,24 +280,39 @@ def verify_file(fName: str, strict: bool) -> str:
 def pretty_print_response_records(inData: Any) -> None:
     """Helper: Pretty print response records.
 
+    Records are collected into a single 'Group' so that the console
+    renders and flushes everything in one go. We import 'rich' here
+    as this helper is only used for debugging.
+
     Args:
         inData:
             Data (response records) to be printed.
     """
+    from rich import get_console
+    from rich.console import Group
+    from rich.pretty import Pretty
+    from rich.rule import Rule
 
-    def _print_item(item: Any, printRule: bool = False) -> None:
-        if printRule:
-            rprint(Rule())
+    rule = Rule()
+    renderables: List[Any] = []
+    recList = inData if isinstance(inData, list) else [inData]
 
-        rprint(type(item))
-        rpp(item, expand_all=True)
+    # Each queue item is '(record, printRule, canExpand)'. Only top-level
+    # records that are lists are expanded into their sub-records.
+    queue = deque((rec, i > 0, True) for i, rec in enumerate(recList))
+    while queue:
+        item, printRule, canExpand = queue.popleft()
 
-    recList = inData if isinstance(inData, list) else [inData]
+        if canExpand and isinstance(item, list):
+            queue.extendleft(
+                reversed([(sub, printRule and ii > 0, False) for ii, sub in enumerate(item)])
+            )
+            continue
+
+        if printRule:
+            renderables.append(rule)
 
-    for i, rec in enumerate(recList):
-        if isinstance(rec, list):
-            for ii, subRec in enumerate(rec):
-                _print_item(subRec, i > 0 and ii > 0)
+        renderables.append(Pretty(type(item)))
+        renderables.append(Pretty(item, expand_all=True))
 
-        else:
-            _print_item(rec, i > 0)
+    get_console().print(Group(*renderables))
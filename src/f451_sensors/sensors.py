@@ -13,10 +13,14 @@ Note:
 """
 import logging
 import pprint
+from concurrent.futures import ThreadPoolExecutor
 from configparser import ConfigParser
+from types import MappingProxyType
 from typing import Any
 from typing import Dict
 from typing import List
+from typing import Mapping
+from typing import Optional
 from typing import Union
 
 import f451_sensors.constants as const
@@ -37,9 +41,10 @@ pp = pprint.PrettyPrinter(indent=4)
 typeDefProvider = Union[Chameleon, None]
 typeDefStringLists = Union[str, List[str], None]
 typeDefSensorInfo = Union[
-    ConfigParser, Dict[str, str], Dict[str, Any], List[str], None
+    ConfigParser, Dict[str, str], Dict[str, Any], Mapping[str, str], List[str], None
 ]
 typeDefSendMsgResponse = Union[List[sensor.Response], Any]
+typeDefSectionOpts = Optional[Dict[str, str]]
 
 
 # =========================================================
@@ -65,8 +70,16 @@ class Sensors(sensor.Sensor):
 
         settings = utils.process_config(config, False)
 
-        self.default_sensors = settings
-        self.sensor_map = settings
+        # Main section options are read into a plain 'dict' once and all
+        # main settings (default sensors, sensor map, etc.) use this dict.
+        self._main_opts: Dict[str, str] = (
+            dict(settings.items(const.SENSOR_MAIN))
+            if settings.has_section(const.SENSOR_MAIN)
+            else {}
+        )
+
+        self.default_sensors = self._main_opts
+        self.sensor_map = self._main_opts
         self.sensors = settings
 
     @property
@@ -77,14 +90,42 @@ class Sensors(sensor.Sensor):
     @sensors.setter
     def sensors(self, settings: ConfigParser) -> None:
         """Set 'sensors' property."""
-        self._sensors = {
-            const.SENSOR_TEMP: self._init_temperature(settings),
-            const.SENSOR_HUMID: self._init_humidity(settings),
-            const.SENSOR_WIND: self._init_wind(settings),
-            const.SENSOR_RAIN: self._init_rain(settings),
-            const.SENSOR_SPEED: self._init_speed(settings),
+        inits = {
+            const.SENSOR_TEMP: self._init_temperature,
+            const.SENSOR_HUMID: self._init_humidity,
+            const.SENSOR_WIND: self._init_wind,
+            const.SENSOR_RAIN: self._init_rain,
+            const.SENSOR_SPEED: self._init_speed,
         }
 
+        # Read each sensor section into a plain 'dict' once so that
+        # sensor clients don't have to go through ConfigParser for
+        # every single option.
+        sections = {
+            name: dict(settings.items(name))
+            for name in settings.sections()
+            if name in inits
+        }
+
+        # Sensor clients may need to connect to remote services when they're
+        # created, so we initialize all configured clients in parallel. This
+        # means that '_init_*()' methods must be thread-safe, which they are
+        # as long as they only read from their own 'opts' dict.
+        self._sensors: Dict[str, typeDefProvider] = dict.fromkeys(inits)
+        configured = [name for name in inits if name in sections]
+        if configured:
+            with ThreadPoolExecutor(max_workers=len(configured)) as executor:
+                futures = {
+                    name: executor.submit(inits[name], sections[name], self._main_opts)
+                    for name in configured
+                }
+            self._sensors.update({name: f.result() for name, f in futures.items()})
+
+        # The set of sensors is fixed once initialized, so we cache
+        # valid and enabled sensor names for fast lookups.
+        self._valid = frozenset(self._sensors)
+        self._enabled = frozenset(key for key, val in self._sensors.items() if val)
+
     @property
     def Temperature(self) -> typeDefProvider:
         """Return 'Temperature' sensor client."""
@@ -121,10 +162,13 @@ class Sensors(sensor.Sensor):
         return self._sensor_map
 
     @sensor_map.setter
-    def sensor_map(self, settings: ConfigParser) -> None:
-        """Set 'sensor_map' property."""
-        self._sensor_map = utils.process_key_value_map(
-            settings.get(const.SENSOR_MAIN, const.KWD_SENSOR_MAP, fallback="")
+    def sensor_map(self, mainOpts: Dict[str, str]) -> None:
+        """Set 'sensor_map' property.
+
+        The map is read-only once set.
+        """
+        self._sensor_map = MappingProxyType(
+            utils.process_key_value_map(mainOpts.get(const.KWD_SENSOR_MAP, ""))
         )
 
     def is_valid_sensor(self, inChannels: typeDefStringLists) -> bool:
@@ -137,11 +181,7 @@ class Sensors(sensor.Sensor):
     def is_enabled_sensor(self, inChannels: typeDefStringLists) -> bool:
         """Check if communications sensor is enabled."""
         tmpList = self._normalize_sensor_list(inChannels)
-        return (
-            all(ch in self._sensors and self._sensors[ch] for ch in tmpList)
-            if tmpList
-            else False
-        )
+        return bool(tmpList) and self._enabled.issuperset(tmpList)
 
     @property
     def default_sensors(self) -> typeDefSensorInfo:
@@ -149,194 +189,130 @@ class Sensors(sensor.Sensor):
         return self._default_sensors
 
     @default_sensors.setter
-    def default_sensors(self, settings: ConfigParser) -> None:
+    def default_sensors(self, mainOpts: Dict[str, str]) -> None:
         """Set 'default_sensors' property."""
-        self._default_sensors = str(
-            settings.get(const.SENSOR_MAIN, const.KWD_SENSORS, fallback="")
-        ).split(const.DELIM_STD)
+        self._default_sensors = [
+            name.strip()
+            for name in mainOpts.get(const.KWD_SENSORS, "").split(const.DELIM_STD)
+            if name.strip()
+        ]
 
     def _verify_sensor(self, chName: str, force: bool) -> bool:
         return (
-            (chName != "" and (chName in self._sensors or chName in self._sensor_map))
+            (chName != "" and (chName in self._valid or chName in self._sensor_map))
             if force
             else (chName != "")
         )
 
     @staticmethod
     def _normalize_sensor_list(inChannels: typeDefStringLists) -> List[str]:
-        if inChannels:
-            if isinstance(inChannels, str):
-                return inChannels.split(const.DELIM_STD)
-            elif all(isinstance(ch, str) for ch in inChannels):
-                return inChannels
+        if not inChannels:
+            return []
+        if type(inChannels) is str:
+            return inChannels.split(const.DELIM_STD)
 
-        return []
+        return inChannels if isinstance(inChannels, list) else list(inChannels)
 
     @staticmethod
-    def _init_temperature(settings: ConfigParser) -> typeDefProvider:
+    def _init_temperature(
+        opts: typeDefSectionOpts, mainOpts: Dict[str, str]
+    ) -> typeDefProvider:
         """Initialize Temperature sensor client."""
-        if not settings.has_section(const.SENSOR_TEMP):
+        if opts is None:
             return None
 
-        # fromName = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_FROM,
-        #     fallback=settings.get(
-        #         const.SENSOR_MAILGUN, const.KWD_FROM_NAME, fallback=""
-        #     ),
-        # )
-        #
-        # defaultTo = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_TO,
-        #     fallback=settings.get(
-        #         const.SENSOR_MAILGUN, const.KWD_TO_EMAIL, fallback=""
-        #     ),
-        # )
+        # fromName = mainOpts.get(const.KWD_FROM, opts.get(const.KWD_FROM_NAME, ""))
+        # defaultTo = mainOpts.get(const.KWD_TO, opts.get(const.KWD_TO_EMAIL, ""))
         #
         # return Mailgun(
-        #     apiKey=settings.get(const.SENSOR_MAILGUN, const.KWD_PRIV_KEY, fallback=""),
-        #     fromDomain=settings.get(
-        #         const.SENSOR_MAILGUN, const.KWD_FROM_DOMAIN, fallback=""
-        #     ),
+        #     apiKey=opts.get(const.KWD_PRIV_KEY, ""),
+        #     fromDomain=opts.get(const.KWD_FROM_DOMAIN, ""),
         #     from_name=fromName,
         #     to_email=defaultTo,
-        #     subject=settings.get(const.SENSOR_MAILGUN, const.KWD_SUBJECT, fallback=""),
-        #     tags=settings.get(const.SENSOR_MAILGUN, const.KWD_TAGS, fallback=""),
-        #     tracking=settings.get(
-        #         const.SENSOR_MAILGUN, const.KWD_TRACKING, fallback=""
-        #     ),
-        #     testmode=settings.get(
-        #         const.SENSOR_MAILGUN, const.KWD_TESTMODE, fallback=""
-        #     ),
+        #     subject=opts.get(const.KWD_SUBJECT, ""),
+        #     tags=opts.get(const.KWD_TAGS, ""),
+        #     tracking=opts.get(const.KWD_TRACKING, ""),
+        #     testmode=opts.get(const.KWD_TESTMODE, ""),
         # )
         return None
 
     @staticmethod
-    def _init_humidity(settings: ConfigParser) -> typeDefProvider:
+    def _init_humidity(
+        opts: typeDefSectionOpts, mainOpts: Dict[str, str]
+    ) -> typeDefProvider:
         """Initialize Humidity sensor client."""
-        if not settings.has_section(const.SENSOR_HUMID):
+        if opts is None:
             return None
 
-        # fromSlack = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_FROM,
-        #     fallback=settings.get(
-        #         const.SENSOR_SLACK, const.KWD_FROM_SLACK, fallback=""
-        #     ),
-        # )
-        #
-        # defaultChannel = settings.get(
-        #     const.SENSOR_SLACK, const.KWD_TO_SENSOR, fallback=""
-        # )
+        # fromSlack = mainOpts.get(const.KWD_FROM, opts.get(const.KWD_FROM_SLACK, ""))
+        # defaultChannel = opts.get(const.KWD_TO_SENSOR, "")
         #
         # return Slack(
-        #     authToken=settings.get(
-        #         const.SENSOR_SLACK, const.KWD_AUTH_TOKEN, fallback=""
-        #     ),
-        #     signingSecret=settings.get(
-        #         const.SENSOR_SLACK, const.KWD_SIGN_SECRET, fallback=""
-        #     ),
-        #     appToken=settings.get(
-        #         const.SENSOR_SLACK, const.KWD_APP_TOKEN, fallback=""
-        #     ),
+        #     authToken=opts.get(const.KWD_AUTH_TOKEN, ""),
+        #     signingSecret=opts.get(const.KWD_SIGN_SECRET, ""),
+        #     appToken=opts.get(const.KWD_APP_TOKEN, ""),
         #     to_sensor=defaultChannel,
         #     from_slack=fromSlack,
-        #     icon_emoji=settings.get(
-        #         const.SENSOR_SLACK, const.KWD_ICON_EMOJI, fallback=""
-        #     ),
+        #     icon_emoji=opts.get(const.KWD_ICON_EMOJI, ""),
         # )
         return None
 
     @staticmethod
-    def _init_wind(settings: ConfigParser) -> typeDefProvider:
+    def _init_wind(
+        opts: typeDefSectionOpts, mainOpts: Dict[str, str]
+    ) -> typeDefProvider:
         """Initialize Wind sensor client."""
-        if not settings.has_section(const.SENSOR_WIND):
+        if opts is None:
             return None
 
-        # fromPhone = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_FROM,
-        #     fallback=settings.get(
-        #         const.SENSOR_TWILIO, const.KWD_FROM_PHONE, fallback=""
-        #     ),
-        # )
-        #
-        # defaultTo = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_TO,
-        #     fallback=settings.get(
-        #         const.SENSOR_TWILIO, const.KWD_TO_PHONE, fallback=""
-        #     ),
-        # )
+        # fromPhone = mainOpts.get(const.KWD_FROM, opts.get(const.KWD_FROM_PHONE, ""))
+        # defaultTo = mainOpts.get(const.KWD_TO, opts.get(const.KWD_TO_PHONE, ""))
         #
         # return Twilio(
-        #     acctSID=settings.get(const.SENSOR_TWILIO, const.KWD_ACCT_SID, fallback=""),
-        #     authToken=settings.get(
-        #         const.SENSOR_TWILIO, const.KWD_AUTH_TOKEN, fallback=""
-        #     ),
+        #     acctSID=opts.get(const.KWD_ACCT_SID, ""),
+        #     authToken=opts.get(const.KWD_AUTH_TOKEN, ""),
         #     from_phone=fromPhone,
         #     to_phone=defaultTo,
         # )
         return None
 
     @staticmethod
-    def _init_rain(settings: ConfigParser) -> typeDefProvider:
+    def _init_rain(
+        opts: typeDefSectionOpts, mainOpts: Dict[str, str]
+    ) -> typeDefProvider:
         """Initialize Rain sensor client."""
-        if not settings.has_section(const.SENSOR_RAIN):
+        if opts is None:
             return None
 
-        # defaultTo = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_TO,
-        #     fallback=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_TO_TWITTER, fallback=""
-        #     ),
-        # )
+        # defaultTo = mainOpts.get(const.KWD_TO, opts.get(const.KWD_TO_TWITTER, ""))
         #
         # return Twitter(
-        #     usrKey=settings.get(const.SENSOR_TWITTER, const.KWD_USER_KEY, fallback=""),
-        #     usrSecret=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_USER_SECRET, fallback=""
-        #     ),
-        #     authToken=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_AUTH_TOKEN, fallback=""
-        #     ),
-        #     authSecret=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_AUTH_SECRET, fallback=""
-        #     ),
+        #     usrKey=opts.get(const.KWD_USER_KEY, ""),
+        #     usrSecret=opts.get(const.KWD_USER_SECRET, ""),
+        #     authToken=opts.get(const.KWD_AUTH_TOKEN, ""),
+        #     authSecret=opts.get(const.KWD_AUTH_SECRET, ""),
         #     to_twitter=defaultTo,
-        #     tags=settings.get(const.SENSOR_TWITTER, const.KWD_TAGS, fallback=""),
+        #     tags=opts.get(const.KWD_TAGS, ""),
         # )
         return None
 
     @staticmethod
-    def _init_speed(settings: ConfigParser) -> typeDefProvider:
+    def _init_speed(
+        opts: typeDefSectionOpts, mainOpts: Dict[str, str]
+    ) -> typeDefProvider:
         """Initialize Speed sensor client."""
-        if not settings.has_section(const.SENSOR_SPEED):
+        if opts is None:
             return None
 
-        # defaultTo = settings.get(
-        #     const.SENSOR_MAIN,
-        #     const.KWD_TO,
-        #     fallback=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_TO_TWITTER, fallback=""
-        #     ),
-        # )
+        # defaultTo = mainOpts.get(const.KWD_TO, opts.get(const.KWD_TO_TWITTER, ""))
         #
         # return Twitter(
-        #     usrKey=settings.get(const.SENSOR_TWITTER, const.KWD_USER_KEY, fallback=""),
-        #     usrSecret=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_USER_SECRET, fallback=""
-        #     ),
-        #     authToken=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_AUTH_TOKEN, fallback=""
-        #     ),
-        #     authSecret=settings.get(
-        #         const.SENSOR_TWITTER, const.KWD_AUTH_SECRET, fallback=""
-        #     ),
+        #     usrKey=opts.get(const.KWD_USER_KEY, ""),
+        #     usrSecret=opts.get(const.KWD_USER_SECRET, ""),
+        #     authToken=opts.get(const.KWD_AUTH_TOKEN, ""),
+        #     authSecret=opts.get(const.KWD_AUTH_SECRET, ""),
         #     to_twitter=defaultTo,
-        #     tags=settings.get(const.SENSOR_TWITTER, const.KWD_TAGS, fallback=""),
+        #     tags=opts.get(const.KWD_TAGS, ""),
         # )
         return None
 
@@ -363,22 +339,64 @@ class Sensors(sensor.Sensor):
             else utils.convert_attrib_str_to_list(inList)
         )
 
-        return [
-            ch
-            for ch in [
-                self._sensor_map[item] if item in self._sensor_map else item
-                for item in [
-                    tmp.strip()
-                    for tmp in tmpList
-                    if self._verify_sensor(tmp.strip(), strict)
-                ]
-            ]
-            if self.is_enabled_sensor(ch)
-        ]
+        enabled = self._enabled
+        sensorMap = self._sensor_map
+
+        outList: List[str] = []
+        append = outList.append
+        for tmp in tmpList:
+            name = tmp.strip()
+            if not self._verify_sensor(name, strict):
+                continue
+
+            name = sensorMap.get(name, name)
+            if name in enabled:
+                append(name)
+
+        return outList
 
     def collect_data(self, **kwargs: Any) -> Dict[str, Any]:
-        print("COLLECT DATA called")
-        return {'foo': "bar"}
+        """Collect data from one or more sensors.
+
+        This method collects data from one or more sensors at the same
+        time. The 'sensors' keyword argument defines which sensors to
+        use, and we use the default sensors if it is not present.
+
+        Each sensor is usually bound by I/O (i.e. bus or network) rather
+        than CPU, so we collect data from multiple sensors in parallel.
+        A single sensor is read inline to avoid thread pool overhead.
+
+        Args:
+            kwargs:
+                Additional optional arguments
+
+        Returns:
+            'dict' with data from each sensor keyed by sensor name
+
+        Raises:
+            InvalidSensorError: Sensor is not valid/enabled
+        """
+        snsrList = kwargs.get(const.KWD_SENSORS, self._default_sensors)
+        sensors = self.process_sensor_list(inList=snsrList, strict=True)
+
+        if not sensors:
+            log.error(f"Invalid sensor(s): {snsrList}")
+            raise InvalidSensorError(f"{snsrList}")
+
+        # Sensor names can be repeated (e.g. via aliases), but we only
+        # need to read each sensor once.
+        sensors = list(dict.fromkeys(sensors))
+        if len(sensors) == 1:
+            ch = sensors[0]
+            return {ch: self._sensors[ch].collect_data(**kwargs)}  # type: ignore[union-attr]
+
+        with ThreadPoolExecutor(max_workers=len(sensors)) as executor:
+            futures = {
+                ch: executor.submit(self._sensors[ch].collect_data, **kwargs)  # type: ignore[union-attr]  # noqa: B950
+                for ch in sensors
+            }
+
+        return {ch: f.result() for ch, f in futures.items()}
 
     def publish_data(self, inDelay: int = 1, iterMax: int = 0, **kwargs: Any) -> int:
         print("PUBLISH DATA called")
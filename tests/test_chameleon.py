@@ -0,0 +1,55 @@
+"""Test cases for the chameleon module."""
+import json
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from f451_sensors.providers import chameleon
+
+
+@pytest.fixture
+def client(mocker: Any) -> MagicMock:
+    """Fixture for mocked MQTT client."""
+    mockClient = MagicMock()
+    mockClient.publish.return_value.rc = 0
+    mocker.patch.object(chameleon, "mqttc", mockClient)
+    mocker.patch.object(chameleon.time, "sleep")
+    return mockClient
+
+
+def _published_batches(client: MagicMock) -> Any:
+    return [json.loads(c.args[1]) for c in client.publish.call_args_list]
+
+
+def test_run_smart_sensor_publishes_batches(client: MagicMock) -> None:
+    """It publishes full batches and flushes the rest on exit."""
+    chameleon.run_smart_sensor(iterMax=chameleon.BATCH_SIZE + 3)
+
+    assert [len(b) for b in _published_batches(client)] == [chameleon.BATCH_SIZE, 3]
+    client.publish.return_value.wait_for_publish.assert_called_once_with(
+        chameleon.MQTT_FLUSH_TIMEOUT
+    )
+    client.disconnect.assert_called_once()
+    client.loop_stop.assert_called_once()
+    assert chameleon.mqttc is None
+
+
+def test_run_smart_sensor_publishes_old_batch(client: MagicMock, mocker: Any) -> None:
+    """It publishes a batch early once its oldest sample is too old."""
+    maxAge = chameleon.BATCH_MAX_AGE * 1_000_000_000
+    mocker.patch.object(chameleon.time, "time_ns", side_effect=[0, maxAge, maxAge + 1])
+
+    chameleon.run_smart_sensor(iterMax=3)
+
+    assert [len(b) for b in _published_batches(client)] == [2, 1]
+
+
+def test_run_smart_sensor_skips_wait_on_failed_flush(client: MagicMock) -> None:
+    """It does not wait on a final publish that was never queued."""
+    client.publish.return_value.rc = 4  # MQTT_ERR_NO_CONN
+
+    chameleon.run_smart_sensor(iterMax=1)
+
+    client.publish.return_value.wait_for_publish.assert_not_called()
+    client.loop_stop.assert_called_once()
@@ -0,0 +1,42 @@
+"""Test cases for the _cli_common module."""
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from f451_sensors import _cli_common
+
+
+def test_init_ini_parser_reads_files(tmp_path: Path) -> None:
+    """It reads all given files and skips empty names."""
+    config = tmp_path / "config.ini"
+    config.write_text("[f451_main]\nsensors = f451_temperature\n")
+    secrets = tmp_path / "secrets.ini"
+    secrets.write_text("[f451_influxdb]\nauth_token = abc%def\n")
+
+    parser = _cli_common.init_ini_parser([str(config), "", None, str(secrets)])
+
+    assert parser.get("f451_main", "sensors") == "f451_temperature"
+    assert parser.get("f451_influxdb", "auth_token") == "abc%def"
+
+
+def test_init_ini_parser_raises_on_missing_file(tmp_path: Path) -> None:
+    """It raises 'ValueError' if a config file cannot be read."""
+    missing = str(tmp_path / "missing.ini")
+    with pytest.raises(ValueError, match="missing.ini"):
+        _cli_common.init_ini_parser(missing)
+
+
+def test_load_config_uses_environ(tmp_path: Path, monkeypatch: Any) -> None:
+    """It falls back to paths from OS ENVIRON variables."""
+    config = tmp_path / "config.ini"
+    config.write_text("[f451_main]\nsensors = f451_wind\n")
+    secrets = tmp_path / "secrets.ini"
+    secrets.write_text("[f451_influxdb]\nauth_token = abc\n")
+    monkeypatch.setenv(_cli_common._APP_ENV_CONFIG_, str(config))
+    monkeypatch.setenv(_cli_common._APP_ENV_SECRETS_, str(secrets))
+
+    parser = _cli_common.load_config()
+
+    assert parser.get("f451_main", "sensors") == "f451_wind"
+    assert parser.get("f451_influxdb", "auth_token") == "abc"
@@ -0,0 +1,95 @@
+"""Test cases for the influxdb_consumer module."""
+from configparser import ConfigParser
+from typing import Any
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+import f451_sensors.constants as const
+from f451_sensors import influxdb_consumer as consumer
+
+
+@pytest.fixture
+def userdata() -> Dict[str, Any]:
+    """Fixture for 'userdata' passed to MQTT callbacks."""
+    return {
+        "writer": MagicMock(),
+        const.KWD_BUCKET: "test_bucket",
+        const.KWD_ORG: "test_org",
+        const.KWD_TOPIC: "test_topic",
+    }
+
+
+def test_on_connect_subscribes_to_topic(userdata: Dict[str, Any]) -> None:
+    """It subscribes to the configured topic."""
+    client = MagicMock()
+    consumer.on_connect(client, userdata, {}, 0)
+    client.subscribe.assert_called_once_with("test_topic")
+
+
+def test_on_message_writes_all_samples(userdata: Dict[str, Any]) -> None:
+    """It writes one point per sample in a batch."""
+    msg = MagicMock(topic="temperature", payload=b"[[1, 20], [2, 21.5]]")
+    consumer.on_message(None, userdata, msg)
+
+    userdata["writer"].write.assert_called_once()
+    kwargs = userdata["writer"].write.call_args.kwargs
+    assert kwargs["bucket"] == "test_bucket"
+    assert kwargs["org"] == "test_org"
+    assert len(kwargs["record"]) == 2
+
+
+@pytest.mark.parametrize("payload", [b"17", b"not json", b'[[1, "x"]]', b"[[1]]"])
+def test_on_message_skips_malformed_payload(userdata: Dict[str, Any], payload: bytes) -> None:
+    """It drops malformed payloads without raising."""
+    msg = MagicMock(topic="temperature", payload=payload)
+    consumer.on_message(None, userdata, msg)
+    userdata["writer"].write.assert_not_called()
+
+
+def test_run_uses_config_values(mocker: Any) -> None:
+    """It connects using values from config and flushes on exit."""
+    mockInflux = mocker.patch.object(consumer, "InfluxDBClient")
+    mockMqtt = mocker.patch.object(consumer.mqtt, "Client")
+
+    settings = ConfigParser()
+    settings.read_dict(
+        {
+            const.SRVC_MQTT: {const.KWD_HOST: "broker.local", const.KWD_TOPIC: "t"},
+            const.SRVC_INFLUXDB: {const.KWD_ORG: "org", const.KWD_AUTH_TOKEN: "tkn"},
+        }
+    )
+    consumer.run(settings)
+
+    assert mockInflux.call_args.kwargs["token"] == "tkn"
+    userdata = mockMqtt.call_args.kwargs["userdata"]
+    assert userdata[const.KWD_TOPIC] == "t"
+    assert userdata[const.KWD_BUCKET] == consumer.INFLUXDB_BUCKET
+    mockMqtt.return_value.connect.assert_called_once_with("broker.local")
+    mockInflux.return_value.write_api.return_value.close.assert_called_once()
+    mockInflux.return_value.close.assert_called_once()
+
+
+def test_main_loads_config_files(mocker: Any) -> None:
+    """It passes config file paths from CLI args to 'load_config()'."""
+    mockLoad = mocker.patch.object(consumer, "load_config")
+    mockRun = mocker.patch.object(consumer, "run")
+
+    consumer.main(["--config", "c.ini", "--secrets", "s.ini"])
+
+    mockLoad.assert_called_once_with("c.ini", "s.ini")
+    mockRun.assert_called_once_with(mockLoad.return_value)
+
+
+def test_run_uses_unique_client_id(mocker: Any) -> None:
+    """It defaults to a hostname-based client ID with a clean session."""
+    mocker.patch.object(consumer, "InfluxDBClient")
+    mocker.patch.object(consumer.socket, "gethostname", return_value="myhost")
+    mockMqtt = mocker.patch.object(consumer.mqtt, "Client")
+
+    consumer.run(ConfigParser())
+
+    kwargs = mockMqtt.call_args.kwargs
+    assert kwargs["client_id"] == f"{consumer.MQTT_CLIENT_ID}-myhost"
+    assert kwargs["clean_session"] is True
@@ -1,8 +1,12 @@
 """Test cases for the __main__ module."""
+from typing import Any
+from unittest.mock import MagicMock
+
 import pytest
 from click.testing import CliRunner
 
 from f451_sensors import __main__
+from f451_sensors.exceptions import SensorAccessError
 
 
 @pytest.fixture
@@ -15,3 +19,46 @@ def test_main_succeeds(runner: CliRunner) -> None:
     """It exits with a status code of zero."""
     result = runner.invoke(__main__.main)
     assert result.exit_code == 0
+
+
+def test_collect_temperature_data_stops_on_data(mocker: Any) -> None:
+    """It stops retrying once data is returned."""
+    mockSleep = mocker.patch.object(__main__.time, "sleep")
+    sensors = MagicMock()
+    sensors.collect_temperature_data.side_effect = [None, {}, {"temp": 20}]
+
+    assert __main__.collect_temperature_data(sensors) == {"temp": 20}
+    assert sensors.collect_temperature_data.call_count == 3
+    assert [c.args[0] for c in mockSleep.call_args_list] == [1, 2]
+
+
+def test_collect_temperature_data_backs_off(mocker: Any) -> None:
+    """It doubles the wait between retries and gives up after 'maxRetry'."""
+    mockSleep = mocker.patch.object(__main__.time, "sleep")
+    sensors = MagicMock()
+    sensors.collect_temperature_data.side_effect = SensorAccessError("test")
+
+    assert __main__.collect_temperature_data(sensors, maxRetry=4, waitRetry=3) is None
+    assert sensors.collect_temperature_data.call_count == 4
+    assert [c.args[0] for c in mockSleep.call_args_list] == [3, 6, 12]
+
+
+@pytest.mark.parametrize("arg", ["-V", "--version"])
+def test_main_version_fast_path(mocker: Any, capsys: Any, arg: str) -> None:
+    """It prints the version without building the full CLI parser."""
+    mockParser = mocker.patch.object(__main__, "init_cli_parser")
+
+    with pytest.raises(SystemExit) as e:
+        __main__.main([arg])
+
+    assert e.value.code == 0
+    assert __main__.__version__ in capsys.readouterr().out
+    mockParser.assert_not_called()
+
+
+def test_main_version_flag_as_option_value() -> None:
+    """It leaves '-V' in other positions to the CLI parser."""
+    with pytest.raises(SystemExit) as e:
+        __main__.main(["--sensor", "-V"])
+
+    assert e.value.code == 2
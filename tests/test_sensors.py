@@ -0,0 +1,100 @@
+"""Test cases for the sensors module."""
+from typing import Any
+from typing import Dict
+from unittest.mock import MagicMock
+
+import pytest
+
+import f451_sensors.constants as const
+from f451_sensors import sensors as sensors_mod
+from f451_sensors.exceptions import InvalidSensorError
+from f451_sensors.sensors import Sensors
+
+
+@pytest.fixture
+def config() -> Dict[str, Any]:
+    """Fixture for config with one enabled sensor and a sensor map."""
+    return {
+        const.SENSOR_MAIN: {
+            const.KWD_SENSORS: f" {const.SENSOR_TEMP} ||{const.SENSOR_WIND}| ",
+            const.KWD_SENSOR_MAP: f"temp:{const.SENSOR_TEMP}|wind:{const.SENSOR_WIND}",
+        },
+        const.SENSOR_TEMP: {},
+    }
+
+
+@pytest.fixture
+def sensors(mocker: Any, config: Dict[str, Any]) -> Sensors:
+    """Fixture for 'Sensors' instance where temperature sensor is enabled."""
+    mocker.patch.object(Sensors, "_init_temperature", return_value=object())
+    return Sensors(config)
+
+
+def test_process_sensor_list(sensors: Sensors) -> None:
+    """It maps aliases and keeps only enabled sensors."""
+    assert sensors.process_sensor_list(" temp |wind|f451_temperature|foo") == [
+        const.SENSOR_TEMP,
+        const.SENSOR_TEMP,
+    ]
+
+
+def test_process_sensor_list_strict(sensors: Sensors) -> None:
+    """It drops unknown and empty names in strict mode."""
+    assert sensors.process_sensor_list(["foo", "", " temp "], strict=True) == [
+        const.SENSOR_TEMP
+    ]
+
+
+def test_default_sensors(sensors: Sensors) -> None:
+    """It strips default sensor names and drops empty ones."""
+    assert sensors.default_sensors == [const.SENSOR_TEMP, const.SENSOR_WIND]
+
+
+def test_default_sensors_missing() -> None:
+    """It returns an empty list when no default sensors are configured."""
+    assert Sensors({const.SENSOR_MAIN: {}}).default_sensors == []
+
+
+@pytest.fixture
+def clients(mocker: Any, config: Dict[str, Any]) -> Dict[str, MagicMock]:
+    """Fixture for mocked temperature and wind sensor clients."""
+    temp = MagicMock(**{"collect_data.return_value": 20})
+    wind = MagicMock(**{"collect_data.return_value": 5})
+    mocker.patch.object(Sensors, "_init_temperature", return_value=temp)
+    mocker.patch.object(Sensors, "_init_wind", return_value=wind)
+    config[const.SENSOR_WIND] = {}
+    return {"sensors": Sensors(config), "temp": temp, "wind": wind}
+
+
+def test_collect_data_from_default_sensors(clients: Dict[str, Any]) -> None:
+    """It collects data from all default sensors keyed by name."""
+    assert clients["sensors"].collect_data() == {
+        const.SENSOR_TEMP: 20,
+        const.SENSOR_WIND: 5,
+    }
+
+
+def test_collect_data_single_sensor(clients: Dict[str, Any], mocker: Any) -> None:
+    """It reads a single sensor once and without a thread pool."""
+    mockPool = mocker.patch.object(sensors_mod, "ThreadPoolExecutor")
+
+    data = clients["sensors"].collect_data(sensors="temp|f451_temperature")
+
+    assert data == {const.SENSOR_TEMP: 20}
+    clients["temp"].collect_data.assert_called_once()
+    clients["wind"].collect_data.assert_not_called()
+    mockPool.assert_not_called()
+
+
+def test_collect_data_invalid_sensor(clients: Dict[str, Any]) -> None:
+    """It raises 'InvalidSensorError' if no valid sensors are given."""
+    with pytest.raises(InvalidSensorError):
+        clients["sensors"].collect_data(sensors="foo")
+    clients["temp"].collect_data.assert_not_called()
+
+
+def test_init_gets_main_opts(mocker: Any, config: Dict[str, Any]) -> None:
+    """It passes sensor and main section options to sensor init methods."""
+    mockInit = mocker.patch.object(Sensors, "_init_temperature", return_value=None)
+    Sensors(config)
+    mockInit.assert_called_once_with({}, config[const.SENSOR_MAIN])